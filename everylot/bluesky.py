@@ -1,24 +1,75 @@
 #!/usr/bin/env python3
-from datetime import datetime
-from atproto import Client
+from datetime import datetime, timezone
+import json
 import os
 import logging
+import sqlite3
+import time
+
+# Cached session so repeated runs can skip createSession, which is tightly rate limited
+SESSION_FILE = "~/.everylot/bsky_session.json"
+SESSION_TTL = 2 * 60 * 60  # seconds
+
+# Rate-limit handling for upload_blob/create_record
+MAX_RETRIES = 3
+MAX_RATE_LIMIT_WAIT = 5 * 60  # seconds
+UPLOAD_DAILY_LIMIT = 950  # Bluesky allows 1000 blob uploads per 24h; keep some headroom
+
+
+def rate_limit_reset(error):
+    """
+    Inspect an atproto request error for an HTTP 429 response.
+
+    Args:
+        error (Exception): Exception raised by the atproto client
+
+    Returns:
+        float or None: Epoch seconds from the ratelimit-reset header, 0 if the
+            error is a rate limit without that header, None if it isn't a rate limit
+    """
+    response = getattr(error, "response", None)
+    if getattr(response, "status_code", None) != 429:
+        return None
+
+    headers = getattr(response, "headers", None) or {}
+    for name, value in headers.items():
+        if name.lower() == "ratelimit-reset":
+            try:
+                return float(value)
+            except (TypeError, ValueError):
+                break
+    return 0
 
 class BlueskyPoster:
-    def __init__(self, logger=None):
-        """Initialize the Bluesky poster with credentials from environment."""
+    def __init__(self, logger=None, database=None):
+        """
+        Initialize the Bluesky poster with credentials from environment.
+
+        Args:
+            logger (logging.Logger, optional): Logger to use
+            database (str, optional): SQLite database used to track daily blob uploads
+        """
         self.logger = logger or logging.getLogger('everylot.bluesky')
+        self.database = database
+        self._uploads_conn = None
         self.identifier = os.getenv("BLUESKY_IDENTIFIER")
         self.password = os.getenv("BLUESKY_PASSWORD")
+        self.session_file = os.path.expanduser(os.getenv("BLUESKY_SESSION_FILE", SESSION_FILE))
         
         if not all([self.identifier, self.password]):
             raise ValueError("Missing Bluesky credentials in environment")
         
+        # Imported here since atproto is slow to import and only needed when posting
+        from atproto import Client
+
         self.client = Client()
         self._login()
 
     def _login(self):
-        """Login to Bluesky."""
+        """Login to Bluesky, resuming a cached session when one is available."""
+        if self._resume_session():
+            return
+
         try:
             self.client.login(self.identifier, self.password)
             self.logger.debug("Successfully logged into Bluesky")
@@ -26,6 +77,99 @@ class BlueskyPoster:
             self.logger.error(f"Failed to login to Bluesky: {str(e)}")
             raise
 
+        self._save_session()
+
+    def _resume_session(self):
+        """
+        Resume a recently cached session instead of logging in with the password.
+
+        Returns:
+            bool: True if a cached session was resumed
+        """
+        try:
+            if time.time() - os.path.getmtime(self.session_file) > SESSION_TTL:
+                return False
+            with open(self.session_file) as f:
+                cached = json.load(f)
+        except (OSError, ValueError):
+            return False
+
+        if not isinstance(cached, dict) or cached.get("identifier") != self.identifier:
+            return False
+
+        try:
+            self.client.login(session_string=cached["session"])
+            self.logger.debug("Resumed cached Bluesky session")
+        except Exception as e:
+            self.logger.warning(f"Failed to resume Bluesky session, logging in again: {str(e)}")
+            self.client = type(self.client)()
+            return False
+
+        # Resuming may refresh the tokens; keep the cache on the current ones
+        self._save_session()
+        return True
+
+    def _save_session(self):
+        """Write the current session to disk for later runs."""
+        try:
+            os.makedirs(os.path.dirname(self.session_file) or ".", exist_ok=True)
+            fd = os.open(self.session_file, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+            with os.fdopen(fd, "w") as f:
+                json.dump({
+                    "identifier": self.identifier,
+                    "session": self.client.export_session_string(),
+                }, f)
+        except Exception as e:
+            self.logger.warning(f"Failed to cache Bluesky session: {str(e)}")
+
+    def _call_with_retry(self, func, *args, **kwargs):
+        """
+        Call an atproto client method, waiting out rate limits.
+        On HTTP 429 this sleeps until the ratelimit-reset time (or backs off
+        exponentially if the header is missing), capped at MAX_RATE_LIMIT_WAIT,
+        and retries up to MAX_RETRIES times. Other errors are raised immediately.
+        """
+        for attempt in range(MAX_RETRIES + 1):
+            try:
+                return func(*args, **kwargs)
+            except Exception as e:
+                reset = rate_limit_reset(e)
+                if reset is None or attempt == MAX_RETRIES:
+                    raise
+                wait = reset - time.time() if reset else 2 ** attempt * 10
+                wait = min(max(wait, 1), MAX_RATE_LIMIT_WAIT)
+                self.logger.warning(f"Bluesky rate limit hit, retrying in {wait:.0f}s")
+                time.sleep(wait)
+
+    def _upload_log(self):
+        """Return the connection used to track blob uploads, opening it on first use."""
+        if self._uploads_conn is None:
+            self._uploads_conn = sqlite3.connect(self.database)
+            with self._uploads_conn:
+                self._uploads_conn.execute("CREATE TABLE IF NOT EXISTS bluesky_uploads (uploaded_at REAL NOT NULL)")
+        return self._uploads_conn
+
+    def _uploads_in_last_day(self):
+        """Count blob uploads recorded in the last 24 hours."""
+        return self._upload_log().execute(
+            "SELECT count(*) FROM bluesky_uploads WHERE uploaded_at > ?",
+            (time.time() - 24 * 60 * 60,)
+        ).fetchone()[0]
+
+    def _record_upload(self):
+        """Record a blob upload and drop entries older than a day."""
+        now = time.time()
+        conn = self._upload_log()
+        with conn:
+            conn.execute("INSERT INTO bluesky_uploads (uploaded_at) VALUES (?)", (now,))
+            conn.execute("DELETE FROM bluesky_uploads WHERE uploaded_at <= ?", (now - 24 * 60 * 60,))
+
+    def close(self):
+        """Close the upload-tracking database connection, if open."""
+        if self._uploads_conn is not None:
+            self._uploads_conn.close()
+            self._uploads_conn = None
+
     def post(self, status_text, image_data=None, auditorIds=None, clean_address=None):
         """
         Post to Bluesky with optional image.
@@ -45,13 +189,19 @@ class BlueskyPoster:
                 "repo": self.identifier,
                 "record": {
                     "text": status_text,
-                    "createdAt": datetime.utcnow().isoformat() + "Z",
+                    "createdAt": datetime.now(timezone.utc).isoformat(timespec="seconds").replace("+00:00", "Z"),
                 }
             }
 
             if image_data:
+                # Stay under the daily upload_blob cap
+                if self.database and self._uploads_in_last_day() >= UPLOAD_DAILY_LIMIT:
+                    raise RuntimeError(f"Reached {UPLOAD_DAILY_LIMIT} Bluesky blob uploads in the last 24 hours")
+
                 # Upload the image blob
-                upload_resp = self.client.com.atproto.repo.upload_blob(image_data)
+                upload_resp = self._call_with_retry(self.client.com.atproto.repo.upload_blob, image_data)
+                if self.database:
+                    self._record_upload()
                 
                 # Add image to the post
                 record["record"]["embed"] = {
@@ -63,7 +213,7 @@ class BlueskyPoster:
                 }
 
             # Create the post
-            resp = self.client.com.atproto.repo.create_record(data=record)
+            resp = self._call_with_retry(self.client.com.atproto.repo.create_record, data=record)
             uri = resp["uri"]
             # Convert AT Protocol URI to web URL
             # at://did:plc:xxx/app.bsky.feed.post/zzz -> https://bsky.app/profile/did:plc:xxx/post/zzz
@@ -49,7 +49,7 @@ def main():
         logger.error('No lot found')
         return
 
-    logger.debug('%s address: %s', el.lot['id'], el.lot.get('address'))
+    logger.debug('%s address: %s', el.lot['id'], el.lot['address'])
 
     # Get the streetview image
     image = None
@@ -73,15 +73,16 @@ def main():
         if image:
             filename = f"image_{el.lot['id']}.jpg"
             with open(filename, 'wb') as f:
-                f.write(image.getvalue())
+                f.write(image)
             logger.info(f"Saved image to {filename}")
         else:
             logger.warning("No image to save (image fetching skipped)")
 
     if not args.dry_run:
         if enable_bluesky:
+            bluesky = None
             try:
-                bluesky = BlueskyPoster(logger=logger)
+                bluesky = BlueskyPoster(logger=logger, database=args.database)
                 # Get clean address for ALT text
                 clean_address = el.sanitize_address(el.lot['address'])
                 
@@ -93,6 +94,9 @@ def main():
                     logger.warning("Skipping Bluesky post because no image was fetched")
             except Exception as e:
                 logger.error(f"Failed to post to Bluesky: {e}")
+            finally:
+                if bluesky:
+                    bluesky.close()
 
 if __name__ == '__main__':
     main()
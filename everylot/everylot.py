@@ -1,29 +1,407 @@
 #!/usr/bin/env python3
 import sqlite3
 import logging
-from io import BytesIO
-import requests
+import itertools
+import string
 import os
 
-NEXT_LOT_QUERY = """
-    SELECT ogc_fid AS id, *
-    FROM cincinnati_lots
+# Partial index over the lots still eligible to post, so picking one is an index seek
+UNPOSTED_INDEX = """
+    CREATE INDEX IF NOT EXISTS idx_unposted
+    ON cincinnati_lots (ogc_fid)
     WHERE is_posted = 0
-    AND improvement_value > 0
-    ORDER BY RANDOM()
+    AND improvement_value > 0;
+"""
+
+# Seek to a random ogc_fid and take the next eligible lot
+NEXT_LOT_QUERY = """
+    SELECT l.ogc_fid AS id, l.*, z.description AS zoning_desc
+    FROM cincinnati_lots AS l
+    LEFT JOIN zoning_descriptions AS z ON z.code = l.zoning
+    WHERE l.is_posted = 0
+    AND l.improvement_value > 0
+    AND l.ogc_fid >= abs(random()) % (SELECT max(ogc_fid) FROM cincinnati_lots)
+    ORDER BY l.ogc_fid
+    LIMIT 1;
+"""
+
+# Wrap around when the random start lands after the last eligible lot
+FIRST_LOT_QUERY = """
+    SELECT l.ogc_fid AS id, l.*, z.description AS zoning_desc
+    FROM cincinnati_lots AS l
+    LEFT JOIN zoning_descriptions AS z ON z.code = l.zoning
+    WHERE l.is_posted = 0
+    AND l.improvement_value > 0
+    ORDER BY l.ogc_fid
     LIMIT 1;
 """
 
 SPECIFIC_LOT_QUERY = """
-    SELECT ogc_fid AS id, *
-    FROM cincinnati_lots
-    WHERE ogc_fid = ?
+    SELECT l.ogc_fid AS id, l.*, z.description AS zoning_desc
+    FROM cincinnati_lots AS l
+    LEFT JOIN zoning_descriptions AS z ON z.code = l.zoning
+    WHERE l.ogc_fid = ?
     LIMIT 1;
 """
 
+MARK_POSTED_QUERY = """
+    UPDATE cincinnati_lots
+    SET is_posted = 1, post_url = ?, post_date = date('now')
+    WHERE ogc_fid = ?;
+"""
+
 SVAPI = "https://maps.googleapis.com/maps/api/streetview"
 GCAPI = "https://maps.googleapis.com/maps/api/geocode/json"
 
+# Shared HTTP session so Google API calls reuse pooled keep-alive connections.
+# Created on first use so runs that never fetch an image don't import requests.
+_session = None
+
+# On-disk response cache for Street View, enabled with STREETVIEW_CACHE=true
+STREETVIEW_CACHE_NAME = '.streetview_cache'
+STREETVIEW_CACHE_EXPIRE = 30 * 24 * 60 * 60  # seconds
+
+
+def _get_session():
+    """
+    Return the shared requests session, creating it on first use.
+    When STREETVIEW_CACHE is enabled this is a requests-cache CachedSession
+    backed by SQLite, so repeated fetches of the same image skip the API.
+    """
+    global _session
+    if _session is None:
+        from requests.adapters import HTTPAdapter
+
+        if os.getenv('STREETVIEW_CACHE', 'false').lower() == 'true':
+            from requests_cache import CachedSession
+
+            _session = CachedSession(
+                cache_name=STREETVIEW_CACHE_NAME,
+                backend='sqlite',
+                expire_after=STREETVIEW_CACHE_EXPIRE,
+                ignored_parameters=['key']  # Keep the API key out of cache keys and stored URLs
+            )
+        else:
+            import requests
+
+            _session = requests.Session()
+        _session.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=4))
+    return _session
+
+
+# Direction mapping
+DIRECTIONS = {
+    'N': 'North',
+    'S': 'South',
+    'E': 'East',
+    'W': 'West'
+}
+
+# Street type mapping
+STREET_TYPES = {
+    'AVE': 'Avenue',
+    'ST': 'Street',
+    'BLVD': 'Boulevard',
+    'RD': 'Road',
+    'DR': 'Drive',
+    'CT': 'Court',
+    'PL': 'Place',
+    'TER': 'Terrace',
+    'LN': 'Lane',
+    'WAY': 'Way',
+    'CIR': 'Circle',
+    'PKY': 'Parkway',
+    'SQ': 'Square'
+}
+
+# Single lookup for every abbreviation we expand
+ADDRESS_ABBREVIATIONS = {**DIRECTIONS, **STREET_TYPES}
+
+
+def sanitize_address(address):
+    """
+    Convert address components into a clean, readable format.
+    Example: '2023 N DAMEN AVE' -> '2023 North Damen Avenue'
+
+    Args:
+        address (str): Raw address string
+
+    Returns:
+        str: Sanitized address string
+    """
+    if not address:
+        return address
+
+    # Split address into components
+    parts = address.strip().split(',')[0].split()  # Take first part before comma
+    if not parts:
+        return address
+
+    # Street number is kept as-is
+    result = [parts[0]]
+    for part in parts[1:]:
+        expanded = ADDRESS_ABBREVIATIONS.get(part)
+        if expanded is None:  # Street name
+            result.append(part.capitalize())
+        else:  # Direction or street type
+            result.append(expanded)
+            if part in STREET_TYPES:
+                break  # Stop processing after street type
+
+    return ' '.join(result)
+
+
+# Base district descriptions
+BASE_DESCRIPTIONS = {
+    # Single-family
+    "SF-20": "Single-family (20,000 sq ft min lot)",
+    "SF-10": "Single-family (10,000 sq ft min lot)",
+    "SF-6":  "Single-family (6,000 sq ft min lot)",
+    "SF-4":  "Single-family (4,000 sq ft min lot)",
+    "SF-2":  "Single-family (2,000 sq ft min lot)",
+
+    # Multi-family
+    "RMX":    "Residential Mixed",
+    "RM-2.0": "Residential Multi-family (2,000 sq ft land/unit)",
+    "RM-1.2": "Residential Multi-family (1,200 sq ft land/unit)",
+    "RM-0.7": "Residential Multi-family (700 sq ft land/unit)",
+
+    # Office
+    "OL": "Office Limited",
+    "OG": "Office General",
+
+    # Commercial
+    "CN": "Commercial Neighborhood",
+    "CC": "Commercial Community",
+    "CG": "Commercial General",
+
+    # Urban Mix & Downtown
+    "UM": "Urban Mix",
+    "DD": "Downtown Development",
+
+    # Manufacturing
+    "MA": "Manufacturing Agricultural",
+    "ML": "Manufacturing Limited",
+    "MG": "Manufacturing General",
+    "ME": "Manufacturing Exclusive",
+
+    # Riverfront
+    "RF-R": "Riverfront Residential/Recreational",
+    "RF-C": "Riverfront Commercial",
+    "RF-M": "Riverfront Manufacturing",
+
+    # Other
+    "PR": "Parks and Recreation",
+    "IR": "Institutional-Residential",
+    "PD": "Planned Development",
+
+    # Form-Based Code (Transect Zones)
+    "T3E": "T3 Estate (Sub-Urban)",
+    "T3N": "T3 Neighborhood (Sub-Urban)",
+    "T4N.MF": "T4 Neighborhood Medium Footprint (General Urban)",
+    "T4N.SF": "T4 Neighborhood Small Footprint (General Urban)",
+    "T5MS": "T5 Main Street (Urban Center)",
+    "T5N.LS": "T5 Neighborhood Large Setback (Urban Center)",
+    "T5N.SS": "T5 Neighborhood Small Setback (Urban Center)",
+    "T5F": "T5 Flex (Urban Center)",
+}
+
+# Overlay/sub-zone suffixes that may follow a base district
+KNOWN_SUFFIXES = {
+    "T": "Transportation Corridor Overlay",
+    "MH": "Middle Housing Overlay",
+    "B": "Neighborhood Business District",
+    "P": "Pedestrian-Oriented",
+    "A": "Auto-Oriented",
+    "M": "Mixed-Use", # Note: Only for Commercial. RF-M is handled in base.
+    "O": "Open Sub-Zone", # Form-based
+}
+
+
+def _describe_zoning_code(code):
+    """
+    Parses a Cincinnati zoning code into a human-readable description.
+    Handles base districts, form-based codes, and overlays/suffixes.
+    """
+    # Handle Suffixes iteratively
+    # We strip suffixes from the end until we find a match in BASE_DESCRIPTIONS
+    # or run out of parts.
+
+    parts = code.split('-')
+    suffixes = []
+    base_code = code
+
+    # Special handling for Form-Based Codes which have dots (e.g. T4N.MF)
+    # and Riverfront (RF-M) which uses hyphen but is a base code.
+    # We check if the full code is a base code first.
+    if code in BASE_DESCRIPTIONS:
+        return BASE_DESCRIPTIONS[code]
+
+    # Work backwards
+    description_parts = []
+
+    # Naive stripping of suffixes
+    # This loop tries to find the longest prefix that is a base code
+    for i in range(len(parts), 0, -1):
+        candidate_base = "-".join(parts[:i])
+        if candidate_base in BASE_DESCRIPTIONS:
+            base_desc = BASE_DESCRIPTIONS[candidate_base]
+
+            # Process the remaining parts as suffixes
+            remaining_suffixes = parts[i:]
+            suffix_descs = []
+            for suf in remaining_suffixes:
+                if suf in KNOWN_SUFFIXES:
+                    # Context check for 'M' (Mixed vs Manufacturing)
+                    # RF-M is already caught as a base code. 
+                    # So 'M' here is likely Commercial Mixed.
+                    suffix_descs.append(KNOWN_SUFFIXES[suf])
+                else:
+                    suffix_descs.append(suf) # Unknown suffix
+
+            full_desc = f"{base_desc}"
+            if suffix_descs:
+                full_desc += " - " + ", ".join(suffix_descs)
+            return full_desc
+
+    return f"Unknown Zoning Code: {code}"
+
+
+# Most suffixes seen on a single code in the lots data (e.g. T5MS-O-P)
+ZONING_MAX_SUFFIXES = 2
+
+# Every base code with up to ZONING_MAX_SUFFIXES known suffixes, described up front
+ZONING_MAP = {
+    code: _describe_zoning_code(code)
+    for code in (
+        "-".join((base,) + suffixes)
+        for base in BASE_DESCRIPTIONS
+        for n in range(ZONING_MAX_SUFFIXES + 1)
+        for suffixes in itertools.product(KNOWN_SUFFIXES, repeat=n)
+    )
+}
+
+
+# Example Usage:
+# print(get_cincinnati_zoning_description("SF-4-T")) 
+# -> "Single-family (4,000 sq ft min lot) - Transportation Corridor Overlay"
+# print(get_cincinnati_zoning_description("CC-A-MH"))
+# -> "Commercial Community - Auto-Oriented, Middle Housing Overlay"
+def get_cincinnati_zoning_description(code):
+    """
+    Look up the human-readable description of a Cincinnati zoning code.
+    Codes outside ZONING_MAP are parsed on the fly.
+    """
+    return ZONING_MAP.get(code) or _describe_zoning_code(code)
+
+
+def compile_format(fmt):
+    """
+    Parse a str.format template once and return a callable that renders it.
+    Equivalent to fmt.format_map(data) but skips re-parsing the template
+    on every call.
+
+    Args:
+        fmt (str): Python format string with named fields
+
+    Returns:
+        callable: Function taking a mapping and returning the formatted string.
+            Its ``fields`` attribute lists the names the template uses.
+    """
+    formatter = string.Formatter()
+    pieces = []
+    fields = []
+    simple = True
+    for literal, field, spec, conversion in formatter.parse(fmt):
+        if field is not None:
+            # Attribute/index lookups and nested specs need the full formatter
+            if not field.isidentifier() or '{' in spec:
+                simple = False
+            fields.append(field.split('.')[0].split('[')[0])
+            # Nested specs like {zipcode:>{width}} read more fields
+            for _, nested, _, _ in formatter.parse(spec or ''):
+                if nested:
+                    fields.append(nested.split('.')[0].split('[')[0])
+        pieces.append((literal, field, spec, conversion))
+
+    if simple:
+        def render(data):
+            out = []
+            for literal, field, spec, conversion in pieces:
+                out.append(literal)
+                if field is not None:
+                    value = data[field]
+                    if conversion:
+                        value = formatter.convert_field(value, conversion)
+                    out.append(format(value, spec))
+            return ''.join(out)
+    else:
+        def render(data):
+            return fmt.format_map(data)
+
+    # Top-level names the template reads, so callers can pass only those
+    render.fields = tuple(dict.fromkeys(fields))
+    return render
+
+
+def sync_zoning_descriptions(conn):
+    """
+    Keep the zoning_descriptions lookup table (code -> description) in step
+    with get_cincinnati_zoning_description(). The table only holds the
+    distinct codes in use, and is rebuilt whenever any stored description
+    differs from what the code currently produces.
+
+    Args:
+        conn (sqlite3.Connection): Connection to the lots database
+    """
+    conn.execute("CREATE TABLE IF NOT EXISTS zoning_descriptions (code TEXT PRIMARY KEY, description TEXT NOT NULL)")
+
+    codes = [row[0] for row in conn.execute("SELECT DISTINCT zoning FROM cincinnati_lots WHERE zoning IS NOT NULL")]
+    wanted = {code: get_cincinnati_zoning_description(code) for code in codes}
+    stored = dict(conn.execute("SELECT code, description FROM zoning_descriptions").fetchall())
+    if stored == wanted:
+        return
+
+    with conn:
+        conn.execute("DELETE FROM zoning_descriptions")
+        conn.executemany("INSERT INTO zoning_descriptions (code, description) VALUES (?, ?)", wanted.items())
+
+
+# Open connections keyed by database path, so repeated EveryLot instances
+# reuse one connection and its prepared-statement cache
+_CONN_CACHE = {}
+
+
+def _connect(database):
+    """
+    Return the shared connection for a database, opening and configuring it on first use.
+
+    Args:
+        database (str): Path to SQLite database file
+
+    Returns:
+        sqlite3.Connection: Connection with sqlite3.Row rows
+    """
+    conn = _CONN_CACHE.get(database)
+    if conn is not None:
+        return conn
+
+    conn = sqlite3.connect(database, check_same_thread=False, cached_statements=256)
+    conn.row_factory = sqlite3.Row
+
+    # WAL avoids the rollback journal's double write; NORMAL sync is safe under WAL
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA synchronous=NORMAL")
+    conn.execute("PRAGMA temp_store=MEMORY")
+    conn.execute("PRAGMA cache_size=-64000")
+
+    sync_zoning_descriptions(conn)
+    conn.execute(UNPOSTED_INDEX)
+
+    _CONN_CACHE[database] = conn
+    return conn
+
+
 class EveryLot:
 
     def __init__(self, database, search_format=None, print_format=None, id_=None, **kwargs):
@@ -45,21 +423,22 @@ class EveryLot:
 
         self.logger.debug('Search format: %s', self.search_format)
         self.logger.debug('Print format: %s', self.print_format)
+        self._format = compile_format(self.print_format)
 
-        # Connect to database
-        self.conn = sqlite3.connect(database)
-        self.conn.row_factory = sqlite3.Row
+        # Connect to database (shared across instances for the same path)
+        self.conn = _connect(database)
 
         # Get the next lot
         if id_:
             # Get specific ogc_fid
-            cursor = self.conn.execute(SPECIFIC_LOT_QUERY, (id_,))
+            row = self.conn.execute(SPECIFIC_LOT_QUERY, (id_,)).fetchone()
         else:
             # Get a random unposted lot
-            cursor = self.conn.execute(NEXT_LOT_QUERY)
+            row = self.conn.execute(NEXT_LOT_QUERY).fetchone()
+            if row is None:
+                row = self.conn.execute(FIRST_LOT_QUERY).fetchone()
 
-        row = cursor.fetchone()
-        self.lot = dict(row) if row else None
+        self.lot = row
 
     def aim_camera(self):
         """Calculate optimal camera settings based on building height."""
@@ -75,13 +454,88 @@ class EveryLot:
             key (str): Google Street View API key
             
         Returns:
-            BytesIO: Image data
+            bytes: JPEG image data
+        """
+        import requests
+
+        if not key:
+            raise ValueError("Google Street View API key is required")
+
+        params = self.streetview_params(key)
+
+        try:
+            r = _get_session().get(SVAPI, params=params)
+            r.raise_for_status()
+            self.logger.debug('Street View URL: %s', r.url)
+
+            return r.content
+
+        except requests.exceptions.RequestException as e:
+            self.logger.error('Failed to fetch Street View image: %s', str(e))
+            raise
+
+    async def get_streetview_images_async(self, key, ids, concurrency=8):
+        """
+        Fetch Street View images for several lots concurrently.
+        Requires the optional aiohttp dependency.
+
+        Args:
+            key (str): Google Street View API key
+            ids (iterable): ogc_fid values of the lots to fetch
+            concurrency (int): Maximum number of requests in flight
+
+        Returns:
+            dict: JPEG image data (bytes) keyed by ogc_fid
         """
+        import asyncio
+        import aiohttp
+
         if not key:
             raise ValueError("Google Street View API key is required")
 
+        lots = [self.conn.execute(SPECIFIC_LOT_QUERY, (id_,)).fetchone() for id_ in ids]
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def fetch(session, lot):
+            async with semaphore:
+                async with session.get(SVAPI, params=self.streetview_params(key, lot)) as r:
+                    r.raise_for_status()
+                    self.logger.debug('Street View URL: %s', r.url)
+                    return lot['id'], await r.read()
+
+        try:
+            async with aiohttp.ClientSession() as session:
+                results = await asyncio.gather(*(fetch(session, lot) for lot in lots if lot))
+        except aiohttp.ClientError as e:
+            self.logger.error('Failed to fetch Street View images: %s', str(e))
+            raise
+
+        return dict(results)
+
+    def get_streetview_images(self, key, ids, concurrency=8):
+        """
+        Synchronous wrapper around get_streetview_images_async for batch use.
+
+        Returns:
+            dict: JPEG image data (bytes) keyed by ogc_fid
+        """
+        import asyncio
+
+        return asyncio.run(self.get_streetview_images_async(key, ids, concurrency))
+
+    def streetview_params(self, key, lot=None):
+        """
+        Build the Street View API query parameters for a lot.
+
+        Args:
+            key (str): Google Street View API key
+            lot (sqlite3.Row, optional): Lot to aim at, defaults to the current lot
+
+        Returns:
+            dict: Query parameters
+        """
         params = {
-            "location": self.streetviewable_location(key),
+            "location": self.streetviewable_location(key, lot),
             "key": key,
             "size": "640x640"
         }
@@ -92,24 +546,9 @@ class EveryLot:
             'pitch': float(os.getenv('STREETVIEW_PITCH', -10)),
             'zoom': float(os.getenv('STREETVIEW_ZOOM', 0.8))
         })
+        return params
 
-        try:
-            r = requests.get(SVAPI, params=params)
-            r.raise_for_status()
-            self.logger.debug('Street View URL: %s', r.url)
-
-            sv = BytesIO()
-            for chunk in r.iter_content(chunk_size=8192):
-                sv.write(chunk)
-
-            sv.seek(0)
-            return sv
-
-        except requests.exceptions.RequestException as e:
-            self.logger.error('Failed to fetch Street View image: %s', str(e))
-            raise
-
-    def streetviewable_location(self, key):
+    def streetviewable_location(self, key, lot=None):
         """
         Determine the best location for Street View image.
         Uses the formatted address with hardcoded city/state since this is Cincinnati-specific.
@@ -117,13 +556,17 @@ class EveryLot:
         
         Args:
             key (str): Google Geocoding API key
+            lot (sqlite3.Row, optional): Lot to locate, defaults to the current lot
             
         Returns:
             str: Location string for Street View API
         """
+        if lot is None:
+            lot = self.lot
+
         try:
             # Get the address and ensure it's not empty/None
-            address = self.lot.get('address')
+            address = lot['address']
             if not address:
                 raise ValueError('No address available')
                 
@@ -132,188 +575,12 @@ class EveryLot:
             self.logger.debug('Using formatted address for Street View: %s', location)
             return location
             
-        except (KeyError, ValueError) as e:
+        except (IndexError, ValueError) as e:
             raise ValueError(f"No valid location data available: {str(e)}")
 
-    def sanitize_address(self, address):
-        """
-        Convert address components into a clean, readable format.
-        Example: '2023 N DAMEN AVE' -> '2023 North Damen Avenue'
-        
-        Args:
-            address (str): Raw address string
-            
-        Returns:
-            str: Sanitized address string
-        """
-        if not address:
-            return address
-
-        # Split address into components
-        parts = address.strip().split(',')[0].split()  # Take first part before comma
-        if not parts:
-            return address
-
-        # Direction mapping
-        directions = {
-            'N': 'North',
-            'S': 'South',
-            'E': 'East',
-            'W': 'West'
-        }
-
-        # Street type mapping
-        street_types = {
-            'AVE': 'Avenue',
-            'ST': 'Street',
-            'BLVD': 'Boulevard',
-            'RD': 'Road',
-            'DR': 'Drive',
-            'CT': 'Court',
-            'PL': 'Place',
-            'TER': 'Terrace',
-            'LN': 'Lane',
-            'WAY': 'Way',
-            'CIR': 'Circle',
-            'PKY': 'Parkway',
-            'SQ': 'Square'
-        }
-
-        # Process each part
-        result = []
-        for i, part in enumerate(parts):
-            part = part.strip()
-            if i == 0:  # Street number
-                result.append(part)
-            elif part in directions:  # Direction
-                result.append(directions[part])
-            elif part in street_types:  # Street type
-                result.append(street_types[part])
-                break  # Stop processing after street type
-            else:  # Street name
-                result.append(part.capitalize())
-
-        return ' '.join(result)
-
-    # Example Usage:
-    # print(get_cincinnati_zoning_description("SF-4-T")) 
-    # -> "Single-family (4,000 sq ft min lot) - Transportation Corridor Overlay"
-    # print(get_cincinnati_zoning_description("CC-A-MH"))
-    # -> "Commercial Community - Auto-Oriented, Middle Housing Overlay"
-    def get_cincinnati_zoning_description(code):
-        """
-        Parses a Cincinnati zoning code into a human-readable description.
-        Handles base districts, form-based codes, and overlays/suffixes.
-        """
-        # 1. Define Base Descriptions
-        base_descriptions = {
-            # Single-family
-            "SF-20": "Single-family (20,000 sq ft min lot)",
-            "SF-10": "Single-family (10,000 sq ft min lot)",
-            "SF-6":  "Single-family (6,000 sq ft min lot)",
-            "SF-4":  "Single-family (4,000 sq ft min lot)",
-            "SF-2":  "Single-family (2,000 sq ft min lot)",
-            
-            # Multi-family
-            "RMX":    "Residential Mixed",
-            "RM-2.0": "Residential Multi-family (2,000 sq ft land/unit)",
-            "RM-1.2": "Residential Multi-family (1,200 sq ft land/unit)",
-            "RM-0.7": "Residential Multi-family (700 sq ft land/unit)",
-            
-            # Office
-            "OL": "Office Limited",
-            "OG": "Office General",
-            
-            # Commercial
-            "CN": "Commercial Neighborhood",
-            "CC": "Commercial Community",
-            "CG": "Commercial General",
-            
-            # Urban Mix & Downtown
-            "UM": "Urban Mix",
-            "DD": "Downtown Development",
-            
-            # Manufacturing
-            "MA": "Manufacturing Agricultural",
-            "ML": "Manufacturing Limited",
-            "MG": "Manufacturing General",
-            "ME": "Manufacturing Exclusive",
-            
-            # Riverfront
-            "RF-R": "Riverfront Residential/Recreational",
-            "RF-C": "Riverfront Commercial",
-            "RF-M": "Riverfront Manufacturing",
-            
-            # Other
-            "PR": "Parks and Recreation",
-            "IR": "Institutional-Residential",
-            "PD": "Planned Development",
-            
-            # Form-Based Code (Transect Zones)
-            "T3E": "T3 Estate (Sub-Urban)",
-            "T3N": "T3 Neighborhood (Sub-Urban)",
-            "T4N.MF": "T4 Neighborhood Medium Footprint (General Urban)",
-            "T4N.SF": "T4 Neighborhood Small Footprint (General Urban)",
-            "T5MS": "T5 Main Street (Urban Center)",
-            "T5N.LS": "T5 Neighborhood Large Setback (Urban Center)",
-            "T5N.SS": "T5 Neighborhood Small Setback (Urban Center)",
-            "T5F": "T5 Flex (Urban Center)",
-        }
-
-        # 2. Handle Suffixes iteratively
-        # We strip suffixes from the end until we find a match in base_descriptions
-        # or run out of parts.
-        
-        parts = code.split('-')
-        suffixes = []
-        base_code = code
-        
-        # Special handling for Form-Based Codes which have dots (e.g. T4N.MF)
-        # and Riverfront (RF-M) which uses hyphen but is a base code.
-        # We check if the full code is a base code first.
-        if code in base_descriptions:
-            return base_descriptions[code]
-
-        # Iteratively strip known suffixes
-        known_suffixes = {
-            "T": "Transportation Corridor Overlay",
-            "MH": "Middle Housing Overlay",
-            "B": "Neighborhood Business District",
-            "P": "Pedestrian-Oriented",
-            "A": "Auto-Oriented",
-            "M": "Mixed-Use", # Note: Only for Commercial. RF-M is handled in base.
-            "O": "Open Sub-Zone", # Form-based
-        }
-
-        # Work backwards
-        description_parts = []
-        
-        # Naive stripping of suffixes
-        # This loop tries to find the longest prefix that is a base code
-        for i in range(len(parts), 0, -1):
-            candidate_base = "-".join(parts[:i])
-            if candidate_base in base_descriptions:
-                base_desc = base_descriptions[candidate_base]
-                
-                # Process the remaining parts as suffixes
-                remaining_suffixes = parts[i:]
-                suffix_descs = []
-                for suf in remaining_suffixes:
-                    if suf in known_suffixes:
-                        # Context check for 'M' (Mixed vs Manufacturing)
-                        # RF-M is already caught as a base code. 
-                        # So 'M' here is likely Commercial Mixed.
-                        suffix_descs.append(known_suffixes[suf])
-                    else:
-                        suffix_descs.append(suf) # Unknown suffix
-                
-                full_desc = f"{base_desc}"
-                if suffix_descs:
-                    full_desc += " - " + ", ".join(suffix_descs)
-                return full_desc
-
-        return f"Unknown Zoning Code: {code}"
-
+    # Module-level helpers exposed on the class without an extra call layer
+    sanitize_address = staticmethod(sanitize_address)
+    get_cincinnati_zoning_description = staticmethod(get_cincinnati_zoning_description)
 
     def compose(self):
         """
@@ -322,28 +589,35 @@ class EveryLot:
         Returns:
             dict: Post parameters including status text and location
         """
-        # Get the sanitized address
-        sanitized_address = self.sanitize_address(self.lot.get('address', ''))
-        
-        # Create post data with sanitized address
-        post_data = dict(self.lot)
-        post_data['address'] = sanitized_address
-        
+        lot = self.lot
+        columns = lot.keys()
+
+        # Only copy the columns the print format actually uses
+        post_data = {field: lot[field] for field in self._format.fields if field in columns}
+
+        # Sanitize the address
+        if 'address' in post_data:
+            post_data['address'] = self.sanitize_address(post_data['address'])
+
         # Enhance zoning description
         if 'zoning' in post_data:
             old = post_data['zoning']
-            post_data['zoning'] = EveryLot.get_cincinnati_zoning_description(post_data['zoning']) + " (" + old + ")"
-        
+            description = lot['zoning_desc']
+            # NULL until sync_zoning_descriptions has seen this code
+            if description is None:
+                description = self.get_cincinnati_zoning_description(old)
+            post_data['zoning'] = description + " (" + old + ")"
+
         # Format the status text using sanitized address
-        status = self.print_format.format(**post_data)
-        
+        status = self._format(post_data)
+
         # Build the final post data
         result = {
             "status": status,
-            "lat": self.lot.get('lat', 0.0),
-            "long": self.lot.get('lon', 0.0),
+            "lat": lot['lat'] if 'lat' in columns else 0.0,
+            "long": lot['lon'] if 'lon' in columns else 0.0,
         }
-        
+
         return result
 
     def mark_as_posted(self, platform, post_id):
@@ -356,8 +630,15 @@ class EveryLot:
         """
         # For Cincinnati bot, we use is_posted, post_url, and post_date
         # We assume post_id is the URL if platform is bluesky, or we just store it there.
-        self.conn.execute(
-            "UPDATE cincinnati_lots SET is_posted = 1, post_url = ?, post_date = date('now') WHERE ogc_fid = ?",
-            (post_id, self.lot['id'])
-        )
+        self.conn.execute(MARK_POSTED_QUERY, (post_id, self.lot['id']))
         self.conn.commit()
+
+    def mark_many_as_posted(self, posts):
+        """
+        Mark several lots as posted in a single transaction.
+
+        Args:
+            posts (iterable): (ogc_fid, post_id) pairs
+        """
+        with self.conn:
+            self.conn.executemany(MARK_POSTED_QUERY, ((post_id, id_) for id_, post_id in posts))
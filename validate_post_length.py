@@ -1,72 +1,117 @@
 #!/usr/bin/env python3
 import os
-import logging
 import sqlite3
+from multiprocessing import Pool
 from tqdm import tqdm
-from everylot.everylot import EveryLot
+from everylot.everylot import sanitize_address, compile_format, sync_zoning_descriptions
 
-# Setup logging to suppress debug output
-logging.basicConfig(level=logging.WARNING)
-logger = logging.getLogger('everylot')
+# Matches the bot.py default print format
+PRINT_FORMAT = '{address}, {zipcode}\n\nZoning: {zoning}\n\nLand Value: ${land_value:,}\n\nImprovement Value: ${improvement_value:,}\n\nNeighborhood: {neighborhood}\n\nAcreage: {acreage}'
+
+SEPARATOR = "-" * 30 + "\n"
+
+# Chunks handed to each worker process, for finer-grained progress
+CHUNKS_PER_WORKER = 4
+
+LOTS_IN_RANGE_QUERY = """
+    SELECT l.ogc_fid, l.address, l.zoning, z.description AS zoning_desc, l.zipcode,
+        l.land_value, l.improvement_value, l.neighborhood, l.acreage
+    FROM cincinnati_lots AS l
+    LEFT JOIN zoning_descriptions AS z ON z.code = l.zoning
+    WHERE l.ogc_fid BETWEEN ? AND ?
+    ORDER BY l.ogc_fid;
+"""
+
+# Per-process state, set up by _init_worker
+_conn = None
+_render = None
+
+def _init_worker(database):
+    """Open a read-only connection and compile the print format in each worker."""
+    global _conn, _render
+    _conn = sqlite3.connect(f'file:{database}?mode=ro', uri=True)
+    _conn.row_factory = sqlite3.Row
+    _conn.execute("PRAGMA mmap_size=268435456")
+    _conn.execute("PRAGMA cache_size=-50000")
+    _conn.execute("PRAGMA temp_store=MEMORY")
+    _render = compile_format(PRINT_FORMAT)
+
+def _check_chunk(id_range):
+    """
+    Compose the posts for a range of ogc_fids and report the long ones.
+
+    Args:
+        id_range (tuple): Inclusive (first, last) ogc_fid bounds
+
+    Returns:
+        tuple: Number of lots checked, and a list of (ogc_fid, length, output text)
+            for posts over 300 characters; length is None for lots that failed
+    """
+    checked = 0
+    results = []
+    for row in _conn.execute(LOTS_IN_RANGE_QUERY, id_range):
+        checked += 1
+        lot_id = row['ogc_fid']
+
+        try:
+            # Same transformation as EveryLot.compose
+            post_data = dict(row)
+            post_data['address'] = sanitize_address(post_data['address'])
+            post_data['zoning'] = post_data['zoning_desc'] + " (" + post_data['zoning'] + ")"
+
+            status = _render(post_data)
+            length = len(status)
+
+            if length > 300:
+                results.append((lot_id, length, ''.join((f"ID: {lot_id} | Length: {length}\n", status, "\n", SEPARATOR))))
+
+        except Exception as e:
+            results.append((lot_id, None, f"Error processing ID {lot_id}: {e}\n"))
+
+    return checked, results
 
 def main():
     database = 'cincinnati.db'
     output_file = 'long_posts.txt'
-    
+
     print(f"Connecting to {database}...")
     conn = sqlite3.connect(database)
-    conn.row_factory = sqlite3.Row
-    cursor = conn.cursor()
-    
-    # Get all IDs
-    print("Fetching all lot IDs...")
-    cursor.execute("SELECT ogc_fid FROM cincinnati_lots ORDER BY ogc_fid")
-    rows = cursor.fetchall()
-    total_lots = len(rows)
+
+    # Refresh the zoning lookup table (no-op when it is already current)
+    sync_zoning_descriptions(conn)
+
+    total_lots, first_id, last_id = conn.execute(
+        "SELECT count(*), min(ogc_fid), max(ogc_fid) FROM cincinnati_lots"
+    ).fetchone()
+    conn.close()
     print(f"Found {total_lots} lots.")
-    
-    long_posts = []
-    
-    # Initialize EveryLot once
-    # We don't need a specific ID yet, we'll set it in the loop or create new instances
-    # Creating new instances might be cleaner to ensure state reset, but let's see if we can reuse.
-    # EveryLot takes an ID in __init__. Let's just instantiate it inside the loop or modify it.
-    # Looking at EveryLot code, it fetches the lot in __init__. 
-    # So we have to instantiate it for each lot. 
-    # To make it faster, we could optimize, but for 98k lots, instantiating a class is fast enough compared to DB fetch.
-    
+
+    # Split the ogc_fid range into contiguous chunks, one query each
+    workers = os.cpu_count() or 1
+    chunks = []
+    if total_lots:
+        chunk_size = (last_id - first_id) // (workers * CHUNKS_PER_WORKER) + 1
+        chunks = [(start, start + chunk_size - 1) for start in range(first_id, last_id + 1, chunk_size)]
+
+    # Compose posts on every core; each worker reads its own chunks
     print("Validating post lengths...")
+    found = []
+    with Pool(workers, initializer=_init_worker, initargs=(database,)) as pool, \
+            tqdm(total=total_lots) as progress:
+        for checked, results in pool.imap_unordered(_check_chunk, chunks, chunksize=1):
+            found.extend(results)
+            progress.update(checked)
+
+    # Chunks finish out of order; write results by ogc_fid
+    found.sort(key=lambda result: result[0])
+    long_posts = [(lot_id, length) for lot_id, length, _ in found if length is not None]
+
     with open(output_file, 'w') as f:
         f.write(f"Checking {total_lots} lots for posts > 300 characters\n")
         f.write("="*50 + "\n\n")
-        
-        for row in tqdm(rows):
-            lot_id = row['ogc_fid']
-            
-            try:
-                # Initialize EveryLot for this ID
-                # We pass print_format explicitly to match bot.py default
-                print_format = '{address}, {zipcode}\n\nZoning: {zoning}\n\nLand Value: ${land_value:,}\n\nImprovement Value: ${improvement_value:,}\n\nNeighborhood: {neighborhood}\n\nAcreage: {acreage}'
-                
-                el = EveryLot(database, logger=logger, id_=lot_id, print_format=print_format)
-                
-                if not el.lot:
-                    continue
-                
-                # Compose post
-                post_data = el.compose()
-                status = post_data['status']
-                length = len(status)
-                
-                if length > 300:
-                    f.write(f"ID: {lot_id} | Length: {length}\n")
-                    f.write(f"{status}\n")
-                    f.write("-" * 30 + "\n")
-                    long_posts.append((lot_id, length))
-                    
-            except Exception as e:
-                f.write(f"Error processing ID {lot_id}: {e}\n")
-    
+
+        f.writelines(text for _, _, text in found)
+
     print(f"\nDone. Found {len(long_posts)} posts exceeding 300 characters.")
     print(f"Results written to {output_file}")
 